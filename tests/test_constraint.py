@@ -1,42 +1,61 @@
 #  Copyright (c) 2022 zfit
 import numpy as np
 import pytest
+import scipy.linalg
 import scipy.stats
 
 import zfit
+import zfit.z.numpy as znp
 from zfit import z
 from zfit.core.constraint import BaseConstraint, GaussianConstraint, SimpleConstraint
+from zfit.core.testing import make_params
 from zfit.util.container import convert_to_container
 from zfit.util.exception import ShapeIncompatibleError
 
 
 def true_nll_gaussian(x, mu, sigma):
-    x = convert_to_container(x, container=tuple)
-    mu = convert_to_container(mu, container=tuple)
-    sigma = convert_to_container(sigma, container=tuple)
-    constraint = z.constant(0.0)
-    if not len(x) == len(mu) == len(sigma):
+    x, mu, sigma = (
+        znp.stack([z.to_real(val) for val in convert_to_container(values)])
+        for values in (x, mu, sigma)
+    )
+    if not x.shape == mu.shape == sigma.shape:
         raise ValueError("params, mu and sigma have to have the same length.")
-    for x_, mean, sig in zip(x, mu, sigma):
-        constraint += z.reduce_sum(z.square(x_ - mean) / (2.0 * z.square(sig)))
-
-    return constraint
+    return 0.5 * z.reduce_sum(z.square((x - mu) / sigma))
 
 
 def true_gauss_constr_value(x, mu, sigma):
-    logpdf = lambda x, loc, scale: scipy.stats.norm.logpdf(x, loc=loc, scale=scale)
-    return -np.sum(
-        [logpdf(x_, loc=mu, scale=sigma) for x_, mu, sigma in zip(x, mu, sigma)]
-    )
+    x = np.asarray(x, dtype=np.float64)
+    mu = np.asarray(mu, dtype=np.float64)
+    sigma = np.asarray(sigma, dtype=np.float64)
+    return 0.5 * np.sum(((x - mu) / sigma) ** 2 + np.log(2 * np.pi * sigma**2))
 
 
 def true_poisson_constr_value(x, lam):
-    logpdf = lambda x, loc: scipy.stats.poisson.logpmf(x, mu=loc)
-    return -np.sum([logpdf(x_, loc=lam_) for x_, lam_ in zip(x, lam)])
+    return -np.sum(scipy.stats.poisson.logpmf(x, mu=lam))
 
 
 def true_multinormal_constr_value(x, mean, cov):
-    return -scipy.stats.multivariate_normal.logpdf(x, mean=mean, cov=cov)
+    chol = scipy.linalg.cholesky(cov, lower=True)
+    diff = np.asarray(x, dtype=np.float64) - np.asarray(mean, dtype=np.float64)
+    z_ = scipy.linalg.solve_triangular(chol, diff, lower=True)
+    logdet = 2 * np.sum(np.log(np.diag(chol)))
+    return 0.5 * (z_ @ z_ + logdet + diff.size * np.log(2 * np.pi))
+
+
+ORDERBUG_OBSERVED = [1500, 1.0, 1.0, 1.0, 0.5]
+ORDERBUG_SIGMA = [0.05 * 1500, 0.001, 0.01, 0.1, 0.05 * 0.5]
+TRUE_ORDERBUG = true_gauss_constr_value(
+    x=ORDERBUG_OBSERVED, mu=ORDERBUG_OBSERVED, sigma=ORDERBUG_SIGMA
+)
+
+
+@pytest.fixture(scope="module")
+def gauss_ref():
+    param_vals = [5, 6, 3]
+    observed = [3, 6.1, 4.3]
+    sigma = [1, 0.3, 0.7]
+    true_val = true_gauss_constr_value(x=observed, mu=param_vals, sigma=sigma)
+    return param_vals, observed, sigma, true_val
 
 
 def test_base_constraint():  # TODO(Mayou36): upgrade to tf2, use ABC again
@@ -55,12 +74,8 @@ def test_poisson_constrain():
 
 
 def test_gaussian_constraint_shape_errors():
-    param1 = zfit.Parameter("Param1", 5)
-    param2 = zfit.Parameter("Param2", 6)
-
-    obs1 = zfit.Parameter("obs1", 2)
-    obs2 = zfit.Parameter("obs2", 3)
-    obs3 = zfit.Parameter("obs3", 4)
+    param1, param2 = make_params("Param", [5, 6])
+    obs1, obs2, obs3 = make_params("obs", [2, 3, 4])
 
     with pytest.raises(ShapeIncompatibleError):
         GaussianConstraint(
@@ -80,33 +95,44 @@ def test_gaussian_constraint_shape_errors():
         ).value()
 
 
+def test_gaussian_constraint_negative_uncertainty():
+    params = make_params("Param", [5, 6])
+
+    observed = [3.0, 6.1]
+    constr = GaussianConstraint(
+        params=params, observation=observed, uncertainty=[1.0, 0.5]
+    )
+    constr_neg = GaussianConstraint(
+        params=params, observation=observed, uncertainty=[-1.0, 0.5]
+    )
+    assert constr_neg.value().numpy() == pytest.approx(constr.value().numpy())
+
+
 def test_gaussian_constraint_matrix():
-    param1 = zfit.Parameter("Param1", 5)
-    param2 = zfit.Parameter("Param2", 6)
-    params = [param1, param2]
+    params = make_params("Param", [5, 6])
 
     observed = [3.0, 6.1]
     sigma = np.array([[1, 0.3], [0.3, 0.5]])
 
-    trueval = true_multinormal_constr_value(
-        x=zfit.run(params), mean=observed, cov=sigma
-    )
-
     constr = GaussianConstraint(params=params, observation=observed, uncertainty=sigma)
-    constr_np = zfit.run(constr.value())
+    params_np, constr_np = zfit.run([params, constr.value()])
+
+    trueval = true_multinormal_constr_value(x=params_np, mean=observed, cov=sigma)
     assert constr_np == pytest.approx(trueval)
     # assert constr_np == pytest.approx(3.989638)
 
     assert constr.get_cache_deps() == set(params)
 
 
-def test_gaussian_constraint():
-    param_vals = [5, 6, 3]
-    observed = [zfit.Parameter(f"observed {val}", val) for val in [3, 6.1, 4.3]]
-    sigma = [1, 0.3, 0.7]
+def test_gaussian_constraint(gauss_ref):
+    param_vals, observed_vals, sigma, true_val_ref = gauss_ref
+    param_vals = list(param_vals)
+    observed = make_params("observed", observed_vals)
     true_val = true_gauss_constr_value(x=observed, mu=param_vals, sigma=sigma)
     assert true_val == true_gauss_constr_value(x=param_vals, mu=observed, sigma=sigma)
-    params = [zfit.Parameter(f"Param{i}", val) for i, val in enumerate(param_vals)]
+    # the parameters round their values through float32, e.g. 6.1 -> 6.099999904632568
+    assert true_val == pytest.approx(true_val_ref)
+    params = make_params("Param", param_vals)
 
     constr = GaussianConstraint(params=params, observation=observed, uncertainty=sigma)
     constr_np = constr.value().numpy()
@@ -116,8 +142,7 @@ def test_gaussian_constraint():
     param_vals[0] = 2
     params[0].set_value(param_vals[0])
 
-    constr2_np = constr.value().numpy()
-    constr2_newtensor_np = constr.value().numpy()
+    constr2_np, constr2_newtensor_np = zfit.run([constr.value(), constr.value()])
     assert constr2_newtensor_np == pytest.approx(constr2_np)
 
     true_val2 = true_gauss_constr_value(x=param_vals, mu=observed, sigma=sigma)
@@ -135,11 +160,11 @@ def test_gaussian_constraint():
 
 
 def test_gaussian_constraint_orderbug():  # as raised in #162
-    observed = [1500, 1.0, 1.0, 1.0, 0.5]
-    params = [zfit.Parameter(f"param{i}", val) for i, val in enumerate(observed)]
+    observed = ORDERBUG_OBSERVED
+    params = make_params("param", observed)
 
-    sigma = [0.05 * 1500, 0.001, 0.01, 0.1, 0.05 * 0.5]
-    true_val = true_gauss_constr_value(x=observed, mu=observed, sigma=sigma)
+    sigma = ORDERBUG_SIGMA
+    true_val = TRUE_ORDERBUG
 
     constr1 = GaussianConstraint(params=params, observation=observed, uncertainty=sigma)
 
@@ -150,29 +175,21 @@ def test_gaussian_constraint_orderbug():  # as raised in #162
 
 
 def test_gaussian_constraint_orderbug2():  # as raised in #162, failed before fixing
-    param1 = zfit.Parameter("param1", 1500)
-    param5 = zfit.Parameter("param2", 0.5)
-
-    param2 = zfit.Parameter("param3", 1.0)
-    param3 = zfit.Parameter("param4", 1.0)
-    param4 = zfit.Parameter("param5", 1.0)
+    params = make_params("param", [1500, 1.0, 1.0, 1.0, 0.5])
 
     constraint = {
-        "params": [param1, param2, param3, param4, param5],
-        "observation": [1500, 1.0, 1.0, 1.0, 0.5],
-        "uncertainty": [0.05 * 1500, 0.001, 0.01, 0.1, 0.05 * 0.5],
+        "params": params,
+        "observation": ORDERBUG_OBSERVED,
+        "uncertainty": ORDERBUG_SIGMA,
     }
 
     constr1 = GaussianConstraint(**constraint)
     # param_vals = [1500, 1.0, 1.0, 1.0, 0.5]
-    constraint["x"] = [m.numpy() for m in constraint["params"]]
+    constraint["x"], constr_np = zfit.run([constraint["params"], constr1.value()])
+    np.testing.assert_allclose(constraint["x"], constraint["observation"])
 
-    true_val = true_gauss_constr_value(
-        x=constraint["x"], mu=constraint["observation"], sigma=constraint["uncertainty"]
-    )
+    true_val = TRUE_ORDERBUG
 
-    value_tensor = constr1.value()
-    constr_np = value_tensor.numpy()
     assert constr_np == pytest.approx(true_val)
     assert true_val < 1000
     assert true_val == pytest.approx(
@@ -180,25 +197,54 @@ def test_gaussian_constraint_orderbug2():  # as raised in #162, failed before fi
     )  # if failing, change value. Hardcoded for additional layer
 
 
-@pytest.mark.flaky(3)
 def test_gaussian_constraint_sampling():
-    param1 = zfit.Parameter("Param1", 5)
-    params = [param1]
+    params = make_params("Param", [5])
 
     observed = [5]
     sigma = [1]
     constr = GaussianConstraint(params=params, observation=observed, uncertainty=sigma)
 
-    sample = constr.sample(15000)
+    # the tolerances below are more than five standard deviations of the estimates wide
+    sample = constr.sample(150000, seed=(42, 7))
+
+    assert np.mean(sample[params[0]]) == pytest.approx(observed[0], rel=0.01)
+    assert np.std(sample[params[0]]) == pytest.approx(sigma[0], rel=0.01)
+
+
+def test_gaussian_constraint_sampling_antithetic():
+    params = make_params("Param", [5, 6])
+
+    observed = [5.0, 6.1]
+    sigma = [1.0, 0.5]
+    constr = GaussianConstraint(params=params, observation=observed, uncertainty=sigma)
+
+    sample = constr.sample(1000, antithetic=True)
+    # the observation is converted like in the constraint, through float32
+    observed_tensor = z.convert_to_tensor(observed).numpy()
+    for param, obs in zip(params, observed_tensor):
+        assert np.mean(sample[param]) == pytest.approx(obs, rel=1e-8)
+
+    sample_odd = constr.sample(1001, antithetic=True)
+    assert sample_odd[params[0]].shape == (1001,)
+
+    poisson_constr = zfit.constraint.PoissonConstraint(
+        params=params, observation=observed
+    )
+    with pytest.raises(NotImplementedError):
+        poisson_constr.sample(10, antithetic=True)
+
+
+def test_gaussian_constraint_sampling_seed():
+    params = make_params("Param", [5])
+    constr = GaussianConstraint(params=params, observation=[5], uncertainty=[1])
 
-    assert np.mean(sample[param1]) == pytest.approx(observed[0], rel=0.01)
-    assert np.std(sample[param1]) == pytest.approx(sigma[0], rel=0.01)
+    sample1 = constr.sample(100, seed=(42, 7))
+    sample2 = constr.sample(100, seed=(42, 7))
+    np.testing.assert_array_equal(sample1[params[0]], sample2[params[0]])
 
 
 def test_simple_constraint():
-    param1 = zfit.Parameter("Param1", 5)
-    param2 = zfit.Parameter("Param2", 6)
-    params = [param1, param2]
+    params = make_params("Param", [5, 6])
 
     observed = [3.0, 6.1]
     sigma = [1.0, 0.5]
@@ -211,3 +211,20 @@ def test_with_obs_or_axes(graph, testclass):
 
     with pytest.raises(AxesIncompatibleError):
         coords_obs2.with_axes(list(range(10, 15)))
+
+
+def test_coordinates_hash():
+    coords = Coordinates(obs=("a", "b"), axes=(0, 1))
+    equal_coords = [
+        Coordinates(obs=("b", "a")),
+        Coordinates(axes=(1, 0)),
+        Coordinates(obs=("a", "b"), axes=(2, 3)),
+    ]
+    for other in equal_coords:
+        assert coords == other
+        assert hash(coords) == hash(other)
+    assert len({coords, *equal_coords}) == 1
+
+    other_dim = Coordinates(obs=("a", "b", "c"))
+    assert hash(coords) != hash(other_dim)
+    assert len({coords, other_dim}) == 2
@@ -1,4 +1,5 @@
 #  Copyright (c) 2022 zfit
+import numpy as np
 import pytest
 import tensorflow as tf
 
@@ -147,6 +148,112 @@ def test_rect_limits():
     assert upper == 1
 
 
+def test_space_hash():
+    limit_a = Limit((0, 1))
+    limit_b = Limit((2, 3))
+    space1 = Space(["a", "b"], limits={"obs": {("a",): limit_a, ("b",): limit_b}})
+    space2 = Space(["a", "b"], limits={"obs": {("b",): limit_b, ("a",): limit_a}})
+    assert hash(space1) == hash(space2)
+    assert hash(space1) == hash(space1)  # cached
+
+
+def test_limit_rect_area():
+    limit = Limit((0, 2))
+    for _ in range(2):  # cached on the second call
+        area = limit.rect_area()
+        assert tf.is_tensor(area)
+        assert area.numpy().tolist() == [2.0]
+
+
+def test_space_rect_area():
+    space1 = Space("a", limits=(0, 2))
+    space2 = Space(
+        ["a", "b"], limits={"obs": {("a",): Limit((0, 2)), ("b",): Limit((1, 4))}}
+    )
+    for space, true_area in [(space1, 2.0), (space2, 6.0)]:
+        for _ in range(2):  # cached on the second call
+            area = space.rect_area()
+            assert tf.is_tensor(area)
+            assert area.numpy().tolist() == [true_area]
+
+
+def test_inside_guarantee_limits():
+    space1 = Space(["a", "b"], limits=((0, 0), (1, 1)))
+    space2 = Space(["a", "b"], limits=((2, 2), (3, 3)))
+    x = z.constant([[0.5, 0.5], [2.5, 2.5], [5.0, 5.0]])
+    for space in [space1, space1 + space2]:
+        inside = space.inside(x, guarantee_limits=True)
+        assert inside.shape == (3,)
+        assert inside.dtype == tf.bool
+        assert inside.numpy().all()
+
+
+def test_space_copy_rect_limits():
+    space = Space("a", limits=(0, 1))
+    new_space = space.copy(limits=None, rect_limits=(0, 2))
+    lower, upper = new_space.rect_limits
+    assert lower == 0
+    assert upper == 2
+    with pytest.raises(KeyError):
+        space.copy(not_a_key=1)
+
+
+def test_multispace_hash():
+    space1 = Space("a", (0, 1))
+    space2 = Space("a", (2, 3))
+    assert hash(space1 + space2) == hash(space2 + space1)
+
+
+def test_inside_filter_casts_dtype():
+    space = Space(["a", "b"], limits=((0, 0), (1, 1)))
+    x = tf.constant([[0.5, 0.5], [2.0, 0.5]], dtype=tf.float32)
+    inside = space.inside(x)
+    assert inside.numpy().tolist() == [True, False]
+    filtered = space.filter(x)
+    assert filtered.dtype == tf.float64
+    assert filtered.numpy().tolist() == [[0.5, 0.5]]
+
+
+def test_filter_data():
+    space1 = Space("a", limits=(0, 1))
+    space2 = Space("a", limits=(2, 3))
+    data = zfit.Data.from_numpy(obs="a", array=np.array([[0.5], [1.5], [2.5]]))
+    filtered = space1.filter(data)
+    assert filtered.dtype == tf.float64
+    assert filtered.numpy().tolist() == [[0.5]]
+    filtered_multi = (space1 + space2).filter(data)
+    assert filtered_multi.dtype == tf.float64
+    assert filtered_multi.numpy().tolist() == [[0.5], [2.5]]
+
+
+def test_filter_keeps_dtype_and_gradient():
+    space = Space("a", limits=(0, 1))
+    x = tf.constant([[0.5], [2.0]], dtype=tf.float64)
+    assert space.filter(x).dtype == tf.float64
+
+    x = tf.Variable([[0.5], [2.0]], dtype=tf.float64)
+    with tf.GradientTape() as tape:
+        value = tf.reduce_sum(space.filter(x) ** 2)
+    gradient = tf.convert_to_tensor(tape.gradient(value, x))
+    assert gradient.numpy().tolist() == [[1.0], [0.0]]
+
+
+def test_inside_xla_opt_in():
+    space = Space(["a", "b"], limits=((0, 0), (1, 1)))
+    x = z.constant([[0.5, 0.5], [2.0, 0.5]])
+
+    @tf.function
+    def inside_graph(x):
+        return space.inside(x)
+
+    assert not zfit.settings.options.xla_inside
+    zfit.settings.options.xla_inside = True
+    try:
+        assert inside_graph(x).numpy().tolist() == [True, False]
+    finally:
+        zfit.settings.options.xla_inside = False
+
+
 def space_factory(*args, limits=None, **kwargs):
     """
     Args:
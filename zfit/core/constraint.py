@@ -6,6 +6,7 @@ import abc
 from collections import OrderedDict
 from collections.abc import Callable
 
+import numpy as np
 import tensorflow as tf
 import tensorflow_probability as tfp
 from ordered_set import OrderedSet
@@ -23,6 +24,15 @@ from ..util.exception import ShapeIncompatibleError
 tfd = tfp.distributions
 
 
+def _is_constant_array(value) -> bool:
+    """Whether `value` is a purely numerical (nested) array that contains no variables."""
+    if isinstance(value, np.ndarray):
+        return value.dtype != object
+    if isinstance(value, (list, tuple)):
+        return all(_is_constant_array(val) for val in value)
+    return isinstance(value, (int, float, np.number))
+
+
 class BaseConstraint(ZfitConstraint, BaseNumeric):
     def __init__(
         self,
@@ -131,18 +141,22 @@ class ProbabilityConstraint(BaseConstraint):
     def _get_dependencies(self) -> ztyping.DependentsType:
         return _extract_dependencies(self.get_params())
 
-    def sample(self, n):
+    def sample(self, n, seed=None, antithetic: bool = False):
         """Sample `n` points from the probability density function for the observed value of the parameters.
 
         Args:
             n: The number of samples to be generated.
+            seed: Seed for the sampling. A pair of integers makes the sample reproducible.
+            antithetic: If True, only half of the points are drawn and each one is mirrored
+                at the observed values. The mean of the sample then equals the observation exactly;
+                the points are, however, not independent. Only available for symmetric distributions.
         Returns:
         """
-        sample = self._sample(n=n)
+        sample = self._sample(n=n, seed=seed, antithetic=antithetic)
         return {p: sample[:, i] for i, p in enumerate(self._ordered_params)}
 
     @abc.abstractmethod
-    def _sample(self, n):
+    def _sample(self, n, seed=None, antithetic=False):
         raise NotImplementedError
 
     @property
@@ -190,8 +204,12 @@ class TFProbabilityConstraint(ProbabilityConstraint):
         value = -self.distribution.log_prob(self._params_array)
         return tf.reduce_sum(value)
 
-    def _sample(self, n):
-        return self.distribution.sample(n)
+    def _sample(self, n, seed=None, antithetic=False):
+        if antithetic:
+            raise NotImplementedError(
+                f"Antithetic sampling is not available for {type(self).__name__}."
+            )
+        return self.distribution.sample(n, seed=seed)
 
 
 class GaussianConstraint(TFProbabilityConstraint):
@@ -252,11 +270,45 @@ class GaussianConstraint(TFProbabilityConstraint):
                 )
             return covariance
 
-        distribution = tfd.MultivariateNormalTriL
-        dist_params = lambda observation: dict(
-            loc=observation,
-            scale_tril=tf.linalg.cholesky(create_covariance(observation, uncertainty)),
-        )
+        def create_sigma(mu, sigma):
+            mu = z.convert_to_tensor(mu)
+            sigma = znp.reshape(z.convert_to_tensor(sigma), [-1])
+            params_tensor = z.convert_to_tensor(params)
+
+            if not params_tensor.shape[0] == mu.shape[0] == sigma.shape[0]:
+                raise ShapeIncompatibleError(
+                    f"params_tensor, observation and uncertainty have to have the"
+                    " same length. Currently"
+                    f"param: {params_tensor.shape[0]}, mu: {mu.shape[0]}, "
+                    f"sigma (from uncertainty): {sigma.shape[0]}"
+                )
+            # the covariance squares the uncertainty, so a negative one was accepted
+            return znp.abs(sigma)
+
+        if z.convert_to_tensor(uncertainty).shape.ndims > 1:
+            distribution = tfd.MultivariateNormalTriL
+            if _is_constant_array(uncertainty):
+                # the covariance can't change, factorize it only once
+                create_covariance(observation, uncertainty)  # checks the shapes
+                scale_tril = z.convert_to_tensor(
+                    np.linalg.cholesky(np.asarray(uncertainty, dtype=np.float64))
+                )
+                dist_params = lambda observation: dict(
+                    loc=observation, scale_tril=scale_tril
+                )
+            else:
+                dist_params = lambda observation: dict(
+                    loc=observation,
+                    scale_tril=tf.linalg.cholesky(
+                        create_covariance(observation, uncertainty)
+                    ),
+                )
+        else:  # uncorrelated: independent normals, no matrix needed
+            distribution = tfd.Normal
+            dist_params = lambda observation: dict(
+                loc=z.convert_to_tensor(observation),
+                scale=create_sigma(observation, uncertainty),
+            )
         dist_kwargs = dict(validate_args=True)
 
         super().__init__(
@@ -275,6 +327,15 @@ class GaussianConstraint(TFProbabilityConstraint):
         """Return the covariance matrix of the observed values of the parameters constrained."""
         return self._covariance()
 
+    def _sample(self, n, seed=None, antithetic=False):
+        if not antithetic:
+            return super()._sample(n=n, seed=seed)
+        # the normal distribution is symmetric around the observation
+        sample = self.distribution.sample((n + 1) // 2, seed=seed)
+        loc = z.convert_to_tensor(self.observation)
+        sample = znp.concatenate([sample, 2 * loc - sample], axis=0)
+        return sample[:n]
+
 
 class PoissonConstraint(TFProbabilityConstraint):
     def __init__(
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import functools
+from operator import itemgetter
+
 import numpy as np
 import tensorflow as tf
 
@@ -22,6 +25,9 @@ from ..util.exception import (
 class Coordinates(ZfitOrderableDimensional):
     def __init__(self, obs=None, axes=None):
         obs, axes, n_obs = self._check_convert_obs_axes(obs, axes)
+        # obs and axes are immutable, the sets are used for order-independent comparisons
+        obs, self._obs_set = (None, None) if obs is None else _intern_coords(obs)
+        axes, self._axes_set = (None, None) if axes is None else _intern_coords(axes)
         self._obs = obs
         self._axes = axes
         self._n_obs = n_obs
@@ -132,20 +138,21 @@ class Coordinates(ZfitOrderableDimensional):
             if self.obs is None:
                 new_coords = type(self)(obs=obs, axes=self.axes)
             else:
-                if not set(obs).intersection(self.obs):
+                obs_set = frozenset(obs)
+                if obs_set.isdisjoint(self._obs_set):
                     raise ObsIncompatibleError(
                         f"The requested obs {obs} are not compatible with the current obs "
                         f"{self.obs}"
                     )
 
-                if not frozenset(obs) == frozenset(self.obs):
+                if not obs_set == self._obs_set:
 
-                    if not allow_superset and frozenset(obs) - frozenset(self.obs):
+                    if not allow_superset and not obs_set <= self._obs_set:
                         raise ObsIncompatibleError(
                             f"Obs {obs} are a superset of {self.obs}, not allowed according to flag."
                         )
 
-                    if not allow_subset and set(self.obs) - set(obs):
+                    if not allow_subset and not self._obs_set <= obs_set:
                         raise ObsIncompatibleError(
                             f"Obs {obs} are a subset of {self.obs}, not allowed according to flag."
                         )
@@ -212,18 +219,19 @@ class Coordinates(ZfitOrderableDimensional):
             if self.axes is None:
                 new_coords = type(self)(obs=self.obs, axes=axes)
             else:
-                if not set(axes).intersection(self.axes):
+                axes_set = frozenset(axes)
+                if axes_set.isdisjoint(self._axes_set):
                     raise AxesIncompatibleError(
                         f"The requested axes {axes} are not compatible with the current axes "
                         f"{self.axes}"
                     )
-                if not frozenset(axes) == frozenset(self.axes):
-                    if not allow_superset and set(axes) - set(self.axes):
+                if not axes_set == self._axes_set:
+                    if not allow_superset and not axes_set <= self._axes_set:
                         raise AxesIncompatibleError(
                             f"Axes {axes} are a superset of {self.axes}, not allowed according to flag."
                         )
 
-                    if not allow_subset and set(self.axes) - set(axes):
+                    if not allow_subset and not self._axes_set <= axes_set:
                         raise AxesIncompatibleError(
                             f"Axes {axes} are a subset of {self.axes}, not allowed according to flag."
                         )
@@ -270,13 +278,13 @@ class Coordinates(ZfitOrderableDimensional):
     def _reorder_obs(self, indices: tuple[int]) -> ztyping.ObsTypeReturn:
         obs = self.obs
         if obs is not None:
-            obs = tuple(obs[i] for i in indices)
+            obs = _take_indices(obs, indices)
         return obs
 
     def _reorder_axes(self, indices: tuple[int]) -> ztyping.AxesTypeReturn:
         axes = self.axes
         if axes is not None:
-            axes = tuple(axes[i] for i in indices)
+            axes = _take_indices(axes, indices)
         return axes
 
     def get_reorder_indices(
@@ -307,9 +315,9 @@ class Coordinates(ZfitOrderableDimensional):
             )
 
         if obs_is_defined:
-            old, new = self.obs, [o for o in obs if o in self.obs]
+            old, new = self.obs, tuple(o for o in obs if o in self._obs_set)
         else:
-            old, new = self.axes, [a for a in axes if a in self.axes]
+            old, new = self.axes, tuple(a for a in axes if a in self._axes_set)
 
         new_indices = _reorder_indices(old=old, new=new)
         return new_indices
@@ -393,7 +401,11 @@ class Coordinates(ZfitOrderableDimensional):
                 f" x.value() to get the pure tensor out or rather sort Data accordingly"
                 f" (sort_by...)."
             )
-        new_indices = _reorder_indices(old=coord_old, new=coord_new)
+        coord_old = convert_to_container(coord_old, container=tuple)
+        coord_new = convert_to_container(coord_new, container=tuple)
+        if coord_old == coord_new and not isinstance(x, ZfitData):
+            return x  # already in order, gathering would only copy it
+        new_indices = _reorder_perm(old=coord_old, new=coord_new)
 
         x = z.unstable.gather(x, indices=new_indices, axis=-1)
         return x
@@ -403,16 +415,18 @@ class Coordinates(ZfitOrderableDimensional):
             return NotImplemented
         obs_equal = False
         axes_equal = False
-        if self.obs is not None and other.obs is not None:
-            obs_equal = frozenset(self.obs) == frozenset(other.obs)
+        if self._obs_set is not None and other._obs_set is not None:
+            obs_equal = self._obs_set == other._obs_set
 
-        if self.axes is not None and other.axes is not None:
-            axes_equal = frozenset(self.axes) == frozenset(other.axes)
+        if self._axes_set is not None and other._axes_set is not None:
+            axes_equal = self._axes_set == other._axes_set
         equal = obs_equal or axes_equal
         return equal
 
     def __hash__(self):
-        return 42  # always check with equal...  maybe change in future, use dict that checks for different things.
+        # coordinates are equal if *either* the obs or the axes coincide, so hashing those would break
+        # the consistency with `__eq__`. Equal coordinates always have the same dimensionality though.
+        return hash(self._n_obs)
 
     def __repr__(self):
         return f"<zfit Coordinates obs={self.obs}, axes={self.axes}"
@@ -434,11 +448,37 @@ def _convert_obs_to_str(obs):
     return obs
 
 
-def _reorder_indices(old: list | tuple, new: list | tuple) -> tuple[int]:
-    new_indices = tuple(old.index(o) for o in new)
+def _take_indices(values: tuple, indices: tuple[int]) -> tuple:
+    if len(indices) > 1:
+        return itemgetter(*indices)(values)
+    # itemgetter does not return a tuple for a single index
+    return tuple(values[i] for i in indices)
+
+
+@functools.lru_cache(maxsize=1024)
+def _intern_coords(coords: tuple) -> tuple[tuple, frozenset]:
+    # equal obs/axes are created over and over again, share the tuple and its set
+    return coords, frozenset(coords)
+
+
+@functools.lru_cache(maxsize=1024)
+def _reorder_indices(old: tuple, new: tuple) -> tuple[int]:
+    old_index = {o: i for i, o in enumerate(old)}
+    try:
+        new_indices = tuple(old_index[o] for o in new)
+    except KeyError as error:  # same error as `tuple.index`
+        raise ValueError(f"{error} is not in {old}") from None
     return new_indices
 
 
+@functools.lru_cache(maxsize=1024)
+def _reorder_perm(old: tuple, new: tuple) -> np.ndarray:
+    # as an index array, the gather does not have to convert the indices on every call
+    perm = np.array(_reorder_indices(old=old, new=new), dtype=np.int64)
+    perm.flags.writeable = False  # shared by the cache
+    return perm
+
+
 def convert_to_axes(axes, container=tuple):
     """Convert `obs` to the list of obs, also if it is a
     :py:class:`~ZfitSpace`. Return None if axes is None.
@@ -453,12 +493,10 @@ def convert_to_axes(axes, container=tuple):
     if isinstance(axes, ZfitDimensional):
         new_axes = axes.axes
     else:
-        new_axes = []
         for axis in axes:
             if not isinstance(axis, int):
                 raise TypeError(f"Axes have to be int, not {axis} as in {axes}")
-            else:
-                new_axes.append(axis)
+        new_axes = axes  # only checked, no need to rebuild them
     return container(new_axes)
 
 
@@ -476,11 +514,8 @@ def convert_to_obs_str(obs, container=tuple):
 
     else:
         obs = convert_to_container(value=obs, container=container)
-        new_obs = []
         for ob in obs:
-
             if not isinstance(ob, str):
                 raise TypeError(f"Observables have to be string, not {ob} as in {obs}")
-            else:
-                new_obs.append(ob)
+        new_obs = obs  # only checked, no need to rebuild them
     return container(new_obs)
@@ -805,7 +805,7 @@ def sum_samples(
         sample2 = tf.random.shuffle(sample2)
     sample1 = sample1.value(obs=obs)
     tensor = sample1 + sample2
-    if any([s.weights is not None for s in samples]):
+    if any(s.weights is not None for s in samples):
         raise WorkInProgressError("Cannot combine weights currently")
     weights = None
 
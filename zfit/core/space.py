@@ -18,7 +18,6 @@ import inspect
 import itertools
 import warnings
 from abc import abstractmethod
-from collections import defaultdict
 from contextlib import suppress
 from typing import Union
 
@@ -32,12 +31,13 @@ from .baseobject import BaseObject
 from .coordinates import (
     Coordinates,
     _convert_obs_to_str,
+    _reorder_perm,
     convert_to_axes,
     convert_to_obs_str,
 )
 from .dimension import common_axes, common_obs, limits_overlap
 from .interfaces import ZfitLimit, ZfitOrderableDimensional, ZfitSpace, ZfitPDF
-from .. import z
+from .. import settings, z
 from .._variables.axis import Binnings, RegularBinning
 from ..settings import ztypes
 from ..util import ztyping
@@ -78,7 +78,7 @@ class Any(LimitRangeDefinition):
     def __new__(cls, *args, **kwargs):
         instance = cls._singleton_instance
         if instance is None:
-            instance = super().__new__(cls)
+            instance = object.__new__(cls)
             cls._singleton_instance = instance
 
         return instance
@@ -143,31 +143,59 @@ def calculate_rect_area(rect_limits):
     return area
 
 
-@z.function(wraps="tensor", experimental_relax_shapes=True)
-def inside_rect_limits(x, rect_limits):
+def _inside_rect_limits(x, rect_limits):
     if not x.shape.ndims > 1:
         raise ValueError(
             "x has ndims <= 1, which is most probably not wanted. The default shape for array-like"
             " structures is (nevents, n_obs)."
         )
     lower, upper = z.unstack_x(rect_limits, axis=0)
-    lower = z.convert_to_tensor(lower)
-    upper = z.convert_to_tensor(upper)
-    below_upper = znp.all(tf.less_equal(x, upper), axis=-1)  # if all obs inside
-    above_lower = znp.all(tf.greater_equal(x, lower), axis=-1)
-    inside = tf.logical_and(above_lower, below_upper)
+    inside_per_obs = tf.logical_and(tf.greater_equal(x, lower), tf.less_equal(x, upper))
+    inside = znp.all(inside_per_obs, axis=-1)  # if all obs inside
     return inside
 
 
+@z.function(wraps="tensor", experimental_relax_shapes=True)
+def inside_rect_limits(x, rect_limits):
+    return _inside_rect_limits(x, rect_limits)
+
+
+# purely elementwise comparisons and a reduction, XLA fuses them into a single kernel but recompiles
+# for every new number of events. Opt-in with `zfit.settings.options.xla_inside`.
+@z.function(wraps="tensor", experimental_relax_shapes=True, jit_compile=True)
+def inside_rect_limits_xla(x, rect_limits):
+    return _inside_rect_limits(x, rect_limits)
+
+
+def _inside_rect_limits_maybe_xla(x, rect_limits):
+    if settings.options.xla_inside and not tf.executing_eagerly():
+        return inside_rect_limits_xla(x, rect_limits=rect_limits)
+    return inside_rect_limits(x, rect_limits=rect_limits)
+
+
 @z.function(wraps="tensor", experimental_relax_shapes=True)
 def filter_rect_limits(x, rect_limits, axis=None):
-    return tf.boolean_mask(
-        tensor=x, mask=inside_rect_limits(x, rect_limits=rect_limits, axis=axis)
+    return _boolean_mask(
+        x, mask=inside_rect_limits(x, rect_limits=rect_limits), axis=axis
     )
 
 
+def _boolean_mask(x, mask, axis=None):
+    """Like `tf.boolean_mask`, but finds the selected indices with NumPy when executing eagerly.
+
+    The values themselves are still gathered by TensorFlow, keeping their dtype and gradient.
+    """
+    if tf.executing_eagerly() and not axis:
+        mask = np.asarray(mask)
+        if mask.ndim == 1:
+            return tf.gather(x, np.flatnonzero(mask))
+    return tf.boolean_mask(tensor=x, mask=mask, axis=axis)
+
+
 def convert_to_tensor_or_numpy(obj, dtype=ztypes.float):
-    if contains_tensor(obj):
+    # a numerical array can't contain a tensor, no need to look at every element
+    numerical_array = isinstance(obj, np.ndarray) and obj.dtype != object
+    if not numerical_array and contains_tensor(obj):
         return z.convert_to_tensor(obj, dtype=dtype)
     else:
         with suppress(AttributeError):
@@ -176,6 +204,13 @@ def convert_to_tensor_or_numpy(obj, dtype=ztypes.float):
 
 
 def _sanitize_x_input(x, n_obs):
+    if (
+        isinstance(x, tf.Tensor)  # not tensor-like objects such as `Data` or variables
+        and x.dtype == ztypes.float
+        and x.shape.ndims == 2
+        and x.shape[-1] == n_obs
+    ):
+        return x  # already in the (nevents, n_obs) shape and dtype
     x = z.convert_to_tensor(x)
     if not x.shape.ndims > 1 and n_obs > 1:
         raise ValueError(
@@ -187,7 +222,7 @@ def _sanitize_x_input(x, n_obs):
             x = tf.broadcast_to(x, (1, 1))
         else:
             x = znp.expand_dims(x, axis=-1)
-    if tf.get_static_value(x.shape[-1]) != n_obs:
+    if x.shape[-1] != n_obs:  # static shape, int or None
         raise ShapeIncompatibleError(
             "n_obs and the last dim of x do not agree. Assuming x has shape (..., n_obs)"
         )
@@ -237,7 +272,6 @@ class Limit(
             rect_limits,
             n_obs,
             is_rect,
-            sublimits,
         ) = self._check_convert_input_limits(
             limit_fn=limit_fn, rect_limits=rect_limits, n_obs=n_obs
         )
@@ -245,7 +279,12 @@ class Limit(
         self._rect_limits = rect_limits
         self._n_obs = n_obs
         self._is_rect = is_rect
-        self._sublimits = sublimits
+        # the limits are immutable, checked in every `inside`/`filter` call
+        self._has_limits = rect_limits is not None and rect_limits is not False
+        self._has_rect_limits = self._has_limits and bool(is_rect)
+        self._rect_limits_tf_cached = None
+        self._rect_area = None
+        self._sublimits = None  # created on demand, see `get_sublimits`
 
     def _check_convert_input_limits(self, limit_fn, rect_limits, n_obs):
         if isinstance(limit_fn, ZfitLimit):
@@ -285,13 +324,7 @@ class Limit(
                 limit_fn = rect_limits
                 rect_limits = None
         if return_limits_short:
-            if n_obs > 1:
-                sublimits = [
-                    type(self)(limit_fn=limits_short, n_obs=1) for _ in range(n_obs)
-                ]
-            else:
-                sublimits = (self,)
-            return limits_short, limits_short, n_obs, limits_short, sublimits
+            return limits_short, limits_short, n_obs, limits_short
 
         if not callable(limit_fn):  # limits_fn is actually rect_limits
             rect_limits = limit_fn
@@ -315,8 +348,8 @@ class Limit(
 
         # vectors means more than one n_events, in the first dim
         if not self._experimental_allow_vectors:
-            lower_nevents = tf.get_static_value(lower.shape[0])
-            upper_nevents = tf.get_static_value(upper.shape[0])
+            lower_nevents = lower.shape[0]
+            upper_nevents = upper.shape[0]
             if lower_nevents != 1 or upper_nevents != 1:
                 raise LimitsIncompatibleError(
                     "Vectors (limits with n_events != 1) are not allowed. Experimental"
@@ -325,8 +358,8 @@ class Limit(
                     " To create multiple limits, use the addition operator of simple spaces."
                 )
 
-        lower_nobs = tf.get_static_value(lower.shape[-1])
-        upper_nobs = tf.get_static_value(upper.shape[-1])
+        lower_nobs = lower.shape[-1]
+        upper_nobs = upper.shape[-1]
 
         if not lower_nobs == upper_nobs:
             raise ShapeIncompatibleError(
@@ -339,33 +372,42 @@ class Limit(
             )
 
         if not any(is_range_definition(limit) for limit in (lower, upper)):
-            tf.assert_greater(
-                upper,
-                lower,
-                message="All upper limits have to be larger than the lower limits and are"
-                " given as (lower, upper). Maybe (upper, lower) was entered?",
+            message = (
+                "All upper limits have to be larger than the lower limits and are"
+                " given as (lower, upper). Maybe (upper, lower) was entered?"
             )
+            if isinstance(lower, np.ndarray) and isinstance(upper, np.ndarray):
+                if not np.all(upper > lower):
+                    raise tf.errors.InvalidArgumentError(None, None, message)
+            else:
+                tf.assert_greater(upper, lower, message=message)
 
         n_obs = lower_nobs  # in case it was None
         rect_limits = (lower, upper)
 
+        return limit_fn, rect_limits, n_obs, limits_are_rect
+
+    def _create_sublimits(self):
+        n_obs = self.n_obs
+        if n_obs == 1:
+            return (self,)
+        if not self.has_limits:
+            return tuple(
+                type(self)(limit_fn=self._rect_limits, n_obs=1) for _ in range(n_obs)
+            )
+
         # It can be that there is a function that depends on multiple dimensions, e.g. if we have
         # a `limit_fn` and n_obs > 1. But if we have only rectangular limits, we can split them up
         # which allows later (the Space) to better combine and get subspaces
-
-        # create sublimits to iterate if possible
-        sublimits = []
-        if limits_are_rect and n_obs > 1:
-            for i in range(n_obs):
-                low = z.unstable.gather(lower, (i,), axis=-1)
-                up = z.unstable.gather(upper, (i,), axis=-1)
-                sublimits.append(type(self)(rect_limits=(low, up), n_obs=1))
-        else:
-            sublimits.append(self)
-
-        sublimits = tuple(sublimits)
-
-        return limit_fn, rect_limits, n_obs, limits_are_rect, sublimits
+        if not self.has_rect_limits:
+            return (self,)
+        lower, upper = self._rect_limits
+        return tuple(
+            type(self)(
+                rect_limits=(lower[..., i : i + 1], upper[..., i : i + 1]), n_obs=1
+            )
+            for i in range(n_obs)
+        )
 
     @staticmethod
     def _sanitize_rect_limit(limit) -> ztyping.RectLowerReturnType:
@@ -390,7 +432,7 @@ class Limit(
     @property
     def has_rect_limits(self) -> bool:
         """If the limits are rectangular."""
-        return self.has_limits and self._is_rect
+        return self._has_rect_limits
 
     @property
     def rect_limits(self) -> ztyping.RectLimitsReturnType:
@@ -417,12 +459,17 @@ class Limit(
 
     @property
     def _rect_limits_tf(self) -> ztyping.RectLimitsTFReturnType:
+        if self._rect_limits_tf_cached is not None:
+            return self._rect_limits_tf_cached
         rect_limits = self._rect_limits
         if rect_limits in (None, False):
             return rect_limits
         lower = z.convert_to_tensor(rect_limits[0])
         upper = z.convert_to_tensor(rect_limits[1])
-        return z.convert_to_tensor((lower, upper))
+        rect_limits_tf = z.convert_to_tensor((lower, upper))
+        if tf.executing_eagerly():  # a symbolic tensor can't be reused in another graph
+            self._rect_limits_tf_cached = rect_limits_tf
+        return rect_limits_tf
 
     @property
     def rect_limits_np(self) -> ztyping.RectLimitsNPReturnType:
@@ -470,7 +517,16 @@ class Limit(
 
         Useful, for example, for MC integration.
         """
-        return calculate_rect_area(rect_limits=self._rect_limits_tf)
+        if self._rect_area is None:
+            lower, upper = self.rect_limits
+            if not all(
+                isinstance(limit, np.ndarray) and limit.dtype != object
+                for limit in (lower, upper)
+            ):
+                return calculate_rect_area(rect_limits=self._rect_limits_tf)
+            # numerical limits, no need for TensorFlow. Cached, the limits are immutable
+            self._rect_area = np.prod(upper - lower, axis=-1)
+        return z.convert_to_tensor(self._rect_area)
 
     def inside(
         self, x: ztyping.XTypeInput, guarantee_limits: bool = False
@@ -495,14 +551,14 @@ class Limit(
                 "Cannot call `inside` without limits defined."
             )
         if guarantee_limits and self.has_rect_limits:
-            return tf.broadcast_to(True, x.shape)
+            return tf.ones(tf.shape(x)[:-1], dtype=tf.bool)
         else:
             return self._inside(x, guarantee_limits)
 
     def _inside(self, x, guarantee_limits):
         del guarantee_limits
         if self.has_rect_limits:
-            return inside_rect_limits(x, rect_limits=self._rect_limits_tf)
+            return _inside_rect_limits_maybe_xla(x, rect_limits=self._rect_limits_tf)
         else:
             return self._limit_fn(x)
 
@@ -540,8 +596,8 @@ class Limit(
         return self._filter(x, guarantee_limits, axis=axis)
 
     def _filter(self, x, guarantee_limits, axis):
-        return tf.boolean_mask(
-            tensor=x, mask=self.inside(x, guarantee_limits=guarantee_limits), axis=axis
+        return _boolean_mask(
+            x, mask=self.inside(x, guarantee_limits=guarantee_limits), axis=axis
         )
 
     @property
@@ -586,7 +642,7 @@ class Limit(
 
         Returns:
         """
-        return not (self.limits_are_false or (not self.limits_are_set))
+        return self._has_limits
 
     @property
     def n_obs(self) -> int:
@@ -691,6 +747,8 @@ class Limit(
         Returns:
             The sublimits if it was able to split.
         """
+        if self._sublimits is None:
+            self._sublimits = self._create_sublimits()
         return self._sublimits
 
     def __hash__(self) -> int:
@@ -744,9 +802,13 @@ def less_equal_limits(limit1: Limit, limit2: Limit, allow_graph=True) -> bool:
             lower1, upper1 = limit1.rect_limits
             lower2, upper2 = limit2.rect_limits
 
-    lower_le = z.unstable.reduce_all(z.unstable.less_equal(lower1, lower2), axis=-1)
-    upper_le = z.unstable.reduce_all(z.unstable.less_equal(upper1, upper2), axis=-1)
-    rect_limits_le = z.unstable.logical_and(lower_le, upper_le)
+        lower_le = z.unstable.reduce_all(z.unstable.less_equal(lower1, lower2), axis=-1)
+        upper_le = z.unstable.reduce_all(z.unstable.less_equal(upper1, upper2), axis=-1)
+        rect_limits_le = z.unstable.logical_and(lower_le, upper_le)
+    else:  # all numpy, no need to dispatch
+        lower_le = np.all(np.less_equal(lower1, lower2), axis=-1)
+        upper_le = np.all(np.less_equal(upper1, upper2), axis=-1)
+        rect_limits_le = np.logical_and(lower_le, upper_le)
     # if both are functional, they have to coincide
     if not (limit1.has_rect_limits or limit2.has_rect_limits):
         funcs_equal = limit1.limit_fn == limit2.limit_fn
@@ -780,6 +842,12 @@ def equal_limits(limit1: Limit, limit2: Limit, allow_graph=True) -> bool:
         else:
             lower, upper = limit1.rect_limits
             lower_other, upper_other = limit2.rect_limits
+    else:  # all numpy, no need to dispatch and we can stop at the first difference
+        return bool(
+            np.all(z.unstable.allclose_anyaware(lower, lower_other))
+            and np.all(z.unstable.allclose_anyaware(upper, upper_other))
+            and limit1.limit_fn == limit2.limit_fn
+        )
 
     # TODO add tols
     lower_limits_equal = z.unstable.reduce_all(
@@ -798,6 +866,7 @@ class BaseSpace(ZfitSpace, BaseObject):
         super().__init__(name, **kwargs)
         coords = Coordinates(obs, axes)
         self.coords = coords
+        self._cached_hash = None
 
     @property
     def is_binned(self):
@@ -822,7 +891,7 @@ class BaseSpace(ZfitSpace, BaseObject):
         """
         x = _sanitize_x_input(x, n_obs=self.n_obs)
         if self.has_rect_limits and guarantee_limits:
-            return tf.broadcast_to(True, x.shape)
+            return tf.ones(tf.shape(x)[:-1], dtype=tf.bool)
         inside = self._inside(x, guarantee_limits)
         return inside
 
@@ -852,12 +921,13 @@ class BaseSpace(ZfitSpace, BaseObject):
         """
         if self.has_rect_limits and guarantee_limits:
             return x
+        x = _sanitize_x_input(x, n_obs=self.n_obs)
         filtered = self._filter(x, guarantee_limits)
         return filtered
 
     def _filter(self, x, guarantee_limits):
-        filtered = tf.boolean_mask(
-            tensor=x, mask=self.inside(x, guarantee_limits=guarantee_limits)
+        filtered = _boolean_mask(
+            x, mask=self.inside(x, guarantee_limits=guarantee_limits)
         )
         return filtered
 
@@ -888,7 +958,7 @@ class BaseSpace(ZfitSpace, BaseObject):
 
     @property
     def n_limits(self) -> int:
-        return len(tuple(self))
+        return sum(1 for _ in self)
 
     def __iter__(self) -> Iterable[ZfitSpace]:
         yield self
@@ -967,13 +1037,12 @@ class BaseSpace(ZfitSpace, BaseObject):
     ):
         to_check = []
         if obs is not None and self.obs is not None:
-            to_check.append(obs, self.obs)
+            to_check.append((obs, self.coords._obs_set))
         if axes is not None and self.axes is not None:
-            to_check.append(axes, self.axes)
+            to_check.append((axes, self.coords._axes_set))
 
         for coord, self_coord in to_check:
             coord = frozenset(coord)
-            self_coord = frozenset(self_coord)
             if coord != self_coord:
 
                 if not allow_superset and coord.issuperset(self_coord):
@@ -1047,11 +1116,6 @@ class BaseSpace(ZfitSpace, BaseObject):
     def __ge__(self, other):
         return NotImplemented
 
-    def __eq__(self, other):
-        if not isinstance(other, ZfitSpace):
-            return NotImplemented
-        return equal_space(self, other)
-
     def equal(self, other: object, allow_graph: bool) -> bool | tf.Tensor:
         """Compare the limits on equality. For ANY objects, this also returns true.
 
@@ -1114,10 +1178,13 @@ class BaseSpace(ZfitSpace, BaseObject):
         return self.less_equal(other, allow_graph=False)
 
     def __hash__(self):
-        limits_frozen = tuple(
-            ((key, tuple(ldict.items())) for key, ldict in self._limits_dict.items())
-        )
-        hash_val = hash(tuple((limits_frozen, hash(self.coords), hash(self.binning))))
+        # the limits are only set on creation, the hash can therefore be cached
+        hash_val = self._cached_hash
+        if hash_val is None:
+            hash_val = hash(self.coords) ^ hash(self.binning)
+            for key, ldict in self._limits_dict.items():
+                hash_val ^= hash((key, frozenset(ldict.items())))
+            self._cached_hash = hash_val
         return hash_val
 
     def reorder_x(self, x, x_obs, x_axes, func_obs, func_axes):
@@ -1144,6 +1211,7 @@ class Space(
     ANY = ANY
     ANY_LOWER = ANY_LOWER  # TODO: needed? or move everything inside?
     ANY_UPPER = ANY_UPPER
+    _COPY_KEYS = frozenset(("name", "limits", "binning", "axes", "obs", "rect_limits"))
 
     def __init__(
         self,
@@ -1209,7 +1277,7 @@ class Space(
             axes=self.axes,
             n_obs=self.n_obs,
         )
-        self._limits_dict = limits_dict
+        self._set_limits_dict(limits_dict)
 
         if isinstance(binning, int):
             if not self.n_obs == 1:
@@ -1228,6 +1296,38 @@ class Space(
 
         self._binning = binning
 
+    @classmethod
+    def _from_validated(cls, coords, limits_dict, binning, name="Space"):
+        """Create a Space from a limits dict of a Space with the same set of coordinates.
+
+        The limits are keyed by the coordinates and therefore don't depend on their order, so the
+        conversion and checks in `__init__` can be skipped, for example when only reordering.
+        """
+        space = cls.__new__(cls)
+        super(Space, space).__init__(obs=coords, axes=None, name=name)
+        space._set_limits_dict(limits_dict)
+        space._binning = binning
+        return space
+
+    def _set_limits_dict(self, limits_dict):
+        self._limits_dict = limits_dict
+        # bind the inner dicts directly, they are accessed in the hot paths
+        self._obs_limits = limits_dict.get("obs", {})
+        self._axes_limits = limits_dict.get("axes", {})
+        limits_in_use = self._obs_limits if self.obs is not None else self._axes_limits
+        self._has_rect_limits = bool(limits_in_use) and all(
+            limit.has_rect_limits for limit in limits_in_use.values()
+        )
+        self._rect_limits_cached = None
+        self._rect_area = None
+        # the common case, e.g. any 1D space: a single limit already in the order of the space
+        self._single_limit = None
+        if len(limits_in_use) == 1:
+            ((limit_coords, limit),) = limits_in_use.items()
+            own_coords = self.obs if self.obs is not None else self.axes
+            if isinstance(limit, Limit) and tuple(limit_coords) == own_coords:
+                self._single_limit = limit
+
     # TODO(Mayou36): put it everywhere, multilimits
     @property
     def binning(self):
@@ -1240,14 +1340,6 @@ class Space(
     def is_binned(self):
         return self.binning is not None
 
-    @property
-    def has_rect_limits(self) -> bool:
-        """If there are limits and whether they are rectangular."""
-        return all(
-            limit.has_rect_limits
-            for limit in list(self._limits_dict.values())[0].values()
-        )
-
     def _check_convert_input_limits(
         self,
         limit: ztyping.LowerTypeInput | ztyping.UpperTypeInput,
@@ -1265,7 +1357,7 @@ class Space(
             Limits dictionary containing the observables and/or the axes as a key matching
                 `ZfitLimits` objects.
         """
-        limits_dict = defaultdict(dict)
+        limits_dict = {"obs": {}, "axes": {}}
         input_limits = limit
         if isinstance(input_limits, Space):
             space = input_limits
@@ -1317,8 +1409,9 @@ class Space(
                 }
             else:
                 obs_limit_dict = {}
+                axes_index = {ax: i for i, ax in enumerate(axes)}
                 for axes_lim, lim in input_limits["axes"].items():
-                    obs_coords = tuple(obs[axes.index(ax)] for ax in axes_lim)
+                    obs_coords = tuple(obs[axes_index[ax]] for ax in axes_lim)
                     if isinstance(lim, ZfitOrderableDimensional):
                         lim = lim.with_coords(self.space)
                     obs_limit_dict[obs_coords] = lim
@@ -1334,8 +1427,9 @@ class Space(
                 }
             else:
                 axes_limit_dict = {}
+                obs_index = {ob: i for i, ob in enumerate(obs)}
                 for obs_lim, lim in input_limits["obs"].items():
-                    axes_coords = tuple(axes[obs.index(ob)] for ob in obs_lim)
+                    axes_coords = tuple(axes[obs_index[ob]] for ob in obs_lim)
 
                     if isinstance(lim, ZfitOrderableDimensional):
                         lim = lim.with_coords(self.space)
@@ -1427,6 +1521,8 @@ class Space(
             raise LimitsNotSpecifiedError(
                 f"Limits are False or not set, cannot return the rectangular limits."
             )
+        if self._single_limit is not None:
+            return self._single_limit._rect_limits_tf
         lower_ordered, upper_ordered = self._rect_limits_z()
         rect_limits = z.convert_to_tensor(lower_ordered), z.convert_to_tensor(
             upper_ordered
@@ -1482,11 +1578,15 @@ class Space(
         return self.rect_limits[1]
 
     def _rect_limits_z(self):
+        if self._rect_limits_cached is not None:
+            return self._rect_limits_cached
+        if self._single_limit is not None:
+            return self._single_limit.rect_limits
         limits_coords = []
         rect_lower_unordered = []
         rect_upper_unordered = []
         obs_in_use = self.obs is not None
-        limits_dict = self._limits_dict["obs" if obs_in_use else "axes"]
+        limits_dict = self._obs_limits if obs_in_use else self._axes_limits
 
         for (
             coord_limit,
@@ -1496,21 +1596,52 @@ class Space(
             lower, upper = limit.rect_limits  # to get the numpy or tensor
             rect_lower_unordered.append(lower)
             rect_upper_unordered.append(upper)
-        reorder_kwargs = {"x_obs" if obs_in_use else "x_axes": limits_coords}
+        rect_limits_unordered = rect_lower_unordered + rect_upper_unordered
+        if all(isinstance(lim, np.ndarray) for lim in rect_limits_unordered) and (
+            len({lim.shape[:-1] for lim in rect_limits_unordered}) == 1
+        ):
+            # write the limits directly to their position in the own coords
+            own_coords = self.obs if obs_in_use else self.axes
+            perm = _reorder_perm(old=own_coords, new=tuple(limits_coords))
+            shape = rect_lower_unordered[0].shape[:-1] + (len(limits_coords),)
+            dtype = np.result_type(*rect_limits_unordered)
+            lower_ordered = np.empty(shape, dtype=dtype)
+            upper_ordered = np.empty(shape, dtype=dtype)
+            lower_ordered[..., perm] = np.concatenate(rect_lower_unordered, axis=-1)
+            upper_ordered[..., perm] = np.concatenate(rect_upper_unordered, axis=-1)
+        else:
+            reorder_kwargs = {"x_obs" if obs_in_use else "x_axes": limits_coords}
 
-        # stack the limits and reorder them according to the own coords
-        lower_stacked = z.unstable.concat(rect_lower_unordered, axis=-1)
-        lower_ordered = self.reorder_x(lower_stacked, **reorder_kwargs)
-        upper_stacked = z.unstable.concat(rect_upper_unordered, axis=-1)
-        upper_ordered = self.reorder_x(upper_stacked, **reorder_kwargs)
-        return lower_ordered, upper_ordered
+            # stack the limits and reorder them according to the own coords
+            lower_stacked = z.unstable.concat(rect_lower_unordered, axis=-1)
+            lower_ordered = self.reorder_x(lower_stacked, **reorder_kwargs)
+            upper_stacked = z.unstable.concat(rect_upper_unordered, axis=-1)
+            upper_ordered = self.reorder_x(upper_stacked, **reorder_kwargs)
+        rect_limits = lower_ordered, upper_ordered
+        # symbolic tensors can't be reused in another graph
+        if tf.executing_eagerly() or not any(
+            isinstance(lim, tf.Tensor) for lim in rect_limits
+        ):
+            self._rect_limits_cached = rect_limits
+        return rect_limits
 
     def rect_area(self) -> float | np.ndarray | tf.Tensor:
         """Calculate the total rectangular area of all the limits and axes.
 
         Useful, for example, for MC integration.
         """
-        return calculate_rect_area(rect_limits=self._rect_limits_tf)
+        if self._single_limit is not None:
+            return self._single_limit.rect_area()
+        if self._rect_area is None:
+            lower, upper = self.rect_limits
+            if not all(
+                isinstance(limit, np.ndarray) and limit.dtype != object
+                for limit in (lower, upper)
+            ):
+                return calculate_rect_area(rect_limits=self._rect_limits_tf)
+            # numerical limits, no need for TensorFlow. Cached, the limits are immutable
+            self._rect_area = np.prod(upper - lower, axis=-1)
+        return z.convert_to_tensor(self._rect_area)
 
     @property
     def rect_limits_are_tensors(self) -> bool:
@@ -1531,15 +1662,7 @@ class Space(
     @property
     def has_rect_limits(self) -> bool:
         """If there are limits and whether they are rectangular."""
-        if self.obs is not None:
-            limits_dict = self._limits_dict.get("obs")
-        else:
-            limits_dict = self._limits_dict.get("axes")
-        if not limits_dict:
-            return False
-        rect_limits = [limit.has_rect_limits for limit in limits_dict.values()]
-        all_rect_limits = all(rect_limits)
-        return all_rect_limits and len(rect_limits) > 0
+        return self._has_rect_limits
 
     @property
     def limits_are_false(self) -> bool:
@@ -1550,7 +1673,7 @@ class Space(
         """
         return all(
             limit.limits_are_false
-            for limit in self._limits_dict["obs" if self.obs else "axes"].values()
+            for limit in (self._obs_limits if self.obs else self._axes_limits).values()
         )
 
     @property
@@ -1565,7 +1688,7 @@ class Space(
     def limits_are_set(self):
         return all(
             limit.limits_are_set
-            for limit in self._limits_dict["obs" if self.obs else "axes"].values()
+            for limit in (self._obs_limits if self.obs else self._axes_limits).values()
             if not limit is self
         )
 
@@ -1641,7 +1764,7 @@ class Space(
         Returns:
             int >= 1
         """
-        return len(tuple(self))
+        return 1  # a simple space iterates only over itself
 
     @property
     @deprecated(
@@ -1788,12 +1911,23 @@ class Space(
             coords = self.coords.with_obs(
                 obs, allow_superset=allow_superset, allow_subset=allow_subset
             )
+            if self._same_coords_set(coords):  # only reordered
+                return self._from_validated(
+                    coords, limits_dict=self._limits_dict, binning=self._binning
+                )
             binning = self.binning
             if binning is not None:
                 binning = [binning[ob] for ob in obs if ob in self.obs]
             new_space = type(self)(coords, limits=self._limits_dict, binning=binning)
         return new_space
 
+    def _same_coords_set(self, coords):
+        own_coords = self.coords
+        return (
+            coords._obs_set == own_coords._obs_set
+            and coords._axes_set == own_coords._axes_set
+        )
+
     def with_axes(
         self,
         axes: ztyping.AxesTypeInput | None,
@@ -1856,6 +1990,10 @@ class Space(
                 coords = self.coords.with_axes(
                     axes=axes, allow_superset=allow_superset, allow_subset=allow_subset
                 )
+                if self._same_coords_set(coords):  # only reordered
+                    return self._from_validated(
+                        coords, limits_dict=self._limits_dict, binning=self._binning
+                    )
                 new_space = type(self)(
                     coords, limits=self._limits_dict, binning=self.binning
                 )
@@ -2042,34 +2180,41 @@ class Space(
         Returns:
             :py:class:`~zfit.Space`
         """
-        kwargs = {
-            "name": self.name,
-            "limits": self._limits_dict,
-            "binning": self.binning,
-            "axes": self.axes,
-            "obs": self.obs,
-        }
-        kwargs.update(overwrite_kwargs)
-        if set(overwrite_kwargs) - set(kwargs):
-            raise KeyError(
-                f"Not usable keys in `overwrite_kwargs`: {set(overwrite_kwargs) - set(kwargs)}"
-            )
-        binning = kwargs.get("binning")
+        not_usable = overwrite_kwargs.keys() - self._COPY_KEYS
+        if not_usable:
+            raise KeyError(f"Not usable keys in `overwrite_kwargs`: {not_usable}")
+        get = overwrite_kwargs.get
+        # `binning` creates a new object, only build it if not overwritten
+        binning = get("binning") if "binning" in overwrite_kwargs else self.binning
         # if binning is not None and kwargs.get('obs'):
         #     kwargs['binning'] = [binning[ob] for ob in kwargs['obs']]
-        new_space = type(self)(**kwargs)
+        new_space = type(self)(
+            name=get("name", self.name),
+            limits=get("limits", self._limits_dict),
+            binning=binning,
+            axes=get("axes", self.axes),
+            obs=get("obs", self.obs),
+            rect_limits=get("rect_limits"),
+        )
         return new_space
 
     def _inside(self, x, guarantee_limits):
-        xs_inside = []
+        if self.has_rect_limits:  # one comparison against the combined, ordered limits
+            return _inside_rect_limits_maybe_xla(x, rect_limits=self._rect_limits_tf)
+        if self._single_limit is not None:
+            return self._single_limit.inside(x)
         obs_in_use = self.obs is not None
-        limits_dict = self._limits_dict["obs" if obs_in_use else "axes"]
+        limits_dict = self._obs_limits if obs_in_use else self._axes_limits
+        all_inside = None
         for coords, limit in limits_dict.items():
             reorder_kwargs = {"func_obs" if obs_in_use else "func_axes": coords}
             x_sub = self.reorder_x(x, **reorder_kwargs)
             x_inside = limit.inside(x_sub)
-            xs_inside.append(x_inside)
-        all_inside = znp.all(xs_inside, axis=0)
+            # the common case of a single limit needs no stacking and reduction
+            if all_inside is None:
+                all_inside = x_inside
+            else:
+                all_inside = znp.logical_and(all_inside, x_inside)
         return all_inside
 
     @property  # TODO(discussion): depreceate 1d limits? or keep?
@@ -2140,16 +2285,19 @@ def extract_limits_from_dict(limits_dict, obs=None, axes=None):
         obs_in_use = True
         coords_to_extract = obs
     coords_to_extract = convert_to_container(coords_to_extract)
-    coords_to_extract = set(coords_to_extract)
+    coords_to_extract = frozenset(coords_to_extract)
 
     limits_to_eval = {}
     limit_dict = limits_dict["obs" if obs_in_use else "axes"].items()
-    keys_sorted = sorted(limit_dict, key=lambda x: len(x[0]), reverse=True)
-    for key_coords, limit in keys_sorted:
-        coord_intersec = frozenset(key_coords).intersection(coords_to_extract)
+    # the sort is stable, if all keys have the same length (e.g. split per obs) it's a no-op
+    if len({len(key_coords) for key_coords, _ in limit_dict}) > 1:
+        limit_dict = sorted(limit_dict, key=lambda x: len(x[0]), reverse=True)
+    for key_coords, limit in limit_dict:
+        key_coords_set = frozenset(key_coords)
+        coord_intersec = key_coords_set & coords_to_extract
         if not coord_intersec:  # this limit does not contain any requested obs
             continue
-        if coord_intersec == frozenset(key_coords):
+        if coord_intersec == key_coords_set:
             if isinstance(limit, ZfitOrderableDimensional):  # drop coordinates if given
                 if obs_in_use:
                     limit = limit.with_axes(None)
@@ -2267,14 +2415,18 @@ def combine_spaces(*spaces: Iterable[Space]):
             "Neither `obs` nor `axes` exist in all spaces."
         )
 
-    all_limits_false = all([space.limits_are_false for space in spaces])
-    all_limits_not_set = all([not space.limits_are_set for space in spaces])
-    has_limits = [space.has_limits for space in spaces]
+    all_limits_false = True
+    all_limits_not_set = True
+    all_have_limits = True
+    for space in spaces:  # a single pass for all the limit states
+        all_limits_false = all_limits_false and space.limits_are_false
+        all_limits_not_set = all_limits_not_set and not space.limits_are_set
+        all_have_limits = all_have_limits and space.has_limits
     if all_limits_false:
         limits = False
     elif all_limits_not_set:
         limits = None
-    elif not all(has_limits):
+    elif not all_have_limits:
         raise LimitsNotSpecifiedError(
             "Limits either have to be set, not set, or False for all spaces to be combined."
         )
@@ -2302,19 +2454,21 @@ def combine_spaces(*spaces: Iterable[Space]):
         # TODO: spaces that have multidim limits?
         limits_dict = {}
 
+        spaces_with_coord = {}
+        for space, coords in zip(spaces, all_coords):
+            for coord in coords:
+                spaces_with_coord.setdefault(coord, []).append(space)
         non_unique_coords = set()
         unique_coords = set()
         for coord in common_coords_ordered:
-            if sum(coord in coords for coords in all_coords) > 1:
+            if len(spaces_with_coord[coord]) > 1:
                 non_unique_coords.add(coord)
             else:
                 unique_coords.add(coord)
 
         for coord in common_coords_ordered:
             if coord in unique_coords:
-                space = [
-                    space for space in spaces if coord in get_coord(space, using_obs)
-                ][0]
+                space = spaces_with_coord[coord][0]
                 space = space.get_subspace(
                     obs=unique_coords if using_obs else None,
                     axes=None if using_obs else unique_coords,
@@ -2323,9 +2477,7 @@ def combine_spaces(*spaces: Iterable[Space]):
                 for coord in get_coord(space, using_obs):
                     unique_coords.remove(coord)
             elif coord in non_unique_coords:
-                non_unique_spaces = [
-                    space for space in spaces if coord in get_coord(space, using_obs)
-                ]
+                non_unique_spaces = spaces_with_coord[coord]
                 common_coords_non_unique = list(
                     set.intersection(
                         *(
@@ -2344,11 +2496,10 @@ def combine_spaces(*spaces: Iterable[Space]):
                 ]
 
                 # TODO compare limits
+                non_unique_subspace = non_unique_subspaces[0]
                 any_non_equal = any(
-                    [
-                        non_unique_subspaces[0] != space
-                        for space in non_unique_subspaces[1:]
-                    ]
+                    non_unique_subspace != space
+                    for space in itertools.islice(non_unique_subspaces, 1, None)
                 )
                 if any_non_equal:
                     raise LimitsIncompatibleError(
@@ -2356,7 +2507,6 @@ def combine_spaces(*spaces: Iterable[Space]):
                         f" {non_unique_subspaces}"
                     )
 
-                non_unique_subspace = non_unique_subspaces[0]
                 limits_dict.update(
                     non_unique_subspace.get_limits()["obs" if using_obs else "axes"]
                 )
@@ -2463,6 +2613,8 @@ def less_equal_space(space1, space2, allow_graph=True):
 
 
 def equal_space(space1, space2, allow_graph=True):
+    if space1 is space2:
+        return True
     return compare_multispace(
         space1=space1,
         space2=space2,
@@ -2487,11 +2639,12 @@ def compare_multispace(space1: ZfitSpace, space2: ZfitSpace, comparator: Callabl
     if not (axes_not_none or obs_not_none):  # if both are None
         return False
 
+    # the coordinates hold their obs and axes also as (cached) sets
     if obs_not_none:
-        if set(space1.obs) != set(space2.obs):
+        if space1.coords._obs_set != space2.coords._obs_set:
             return False
     elif axes_not_none:  # axes only matter if there are no obs
-        if set(space1.axes) != set(space2.axes):
+        if space1.coords._axes_set != space2.coords._axes_set:
             return False
     if not space1.binning == space2.binning:
         return False
@@ -2520,15 +2673,14 @@ def compare_limits_multispace(
         return False
     space2_reordered = space2.with_coords(space1)
 
+    limits2_all = [space22.get_limits() for space22 in space2_reordered]
     comparison = []
     for space11 in space1:
-        compare_spaces2 = []
-        for space22 in space2_reordered:
-            compare_spaces2.append(
-                compare_limits_coords_dict(
-                    space11.get_limits(), space22.get_limits(), comparator=comparator
-                )
-            )
+        limits1 = space11.get_limits()
+        compare_spaces2 = [
+            compare_limits_coords_dict(limits1, limits2, comparator=comparator)
+            for limits2 in limits2_all
+        ]
         comparison.append(compare_spaces2)
     comparison = convert_to_tensor_or_numpy(comparison, dtype=tf.bool)
     space1_matches = z.unstable.reduce_any(
@@ -2563,17 +2715,14 @@ def compare_limits_coords_dict(
 
 def compare_limits_dict(dict1: Mapping, dict2: Mapping, comparator: Callable) -> bool:
     comparison = []
-    limits2_to_check = dict2.copy()
+    # the coords of the limits are disjoint, match them by their set
+    limits2_to_check = {frozenset(coord): limit for coord, limit in dict2.items()}
 
     for coord, limit1 in dict1.items():
-        for limit2cord, limit2 in limits2_to_check.items():
-            if set(limit2cord) == set(coord):
-                limit2 = limits2_to_check.pop(limit2cord)
-                comparison.append(comparator(limit1, limit2))
-                break
-
-        else:  # no break, nothing matched
+        limit2 = limits2_to_check.pop(frozenset(coord), None)
+        if limit2 is None:  # nothing matched
             return False
+        comparison.append(comparator(limit1, limit2))
     return z.unstable.reduce_all(comparison, axis=0)
 
 
@@ -2612,6 +2761,10 @@ class MultiSpace(BaseSpace):
             name = "MultiSpace"
         super().__init__(obs, axes, name)
         self.spaces = spaces
+        # the spaces are immutable, summarize their limits once
+        self._has_rect_limits = all(space.has_rect_limits for space in spaces)
+        self._limits_are_false = all(space.limits_are_false for space in spaces)
+        self._limits_are_set = all(space.limits_are_set for space in spaces)
 
     @staticmethod
     def _initialize_space(space, spaces, obs, axes):
@@ -2628,8 +2781,11 @@ class MultiSpace(BaseSpace):
         all_have_obs = all(space.obs is not None for space in spaces)
         all_have_axes = all(space.axes is not None for space in spaces)
         all_binnings_compatible = len({space.binning for space in spaces}) == 1
-        n_events = [space.n_events in (spaces[0].n_events, None) for space in spaces]
-        all_nevents_compatible = all(n_events)
+        first_space = spaces[0]
+        n_events_allowed = (first_space.n_events, None)
+        all_nevents_compatible = all(
+            space.n_events in n_events_allowed for space in spaces
+        )
         if not all_binnings_compatible:
             raise ValueError(
                 "Binnings not compatible, maybe this needs to be better care taken."
@@ -2639,12 +2795,15 @@ class MultiSpace(BaseSpace):
                 "The number of events of the spaces do not coincide"
             )
         if all_have_axes:
-            axes = spaces[0].axes if axes is None else convert_to_axes(axes)
+            axes = first_space.axes if axes is None else convert_to_axes(axes)
 
         if all_have_obs:
-            obs = spaces[0].obs if obs is None else convert_to_obs_str(obs)
+            obs = first_space.obs if obs is None else convert_to_obs_str(obs)
+            # spaces that are already ordered (e.g. from another MultiSpace) don't need a new copy
             spaces = [
-                space.with_obs(obs, allow_subset=False, allow_superset=False)
+                space
+                if space.obs == obs
+                else space.with_obs(obs, allow_subset=False, allow_superset=False)
                 for space in spaces
             ]
             if not (
@@ -2655,7 +2814,9 @@ class MultiSpace(BaseSpace):
         elif all_have_axes:
             if all(space.obs is None for space in spaces):
                 spaces = [
-                    space.with_axes(axes, allow_superset=False, allow_subset=False)
+                    space
+                    if space.axes == axes
+                    else space.with_axes(axes, allow_superset=False, allow_subset=False)
                     for space in spaces
                 ]
             if not (
@@ -2668,10 +2829,11 @@ class MultiSpace(BaseSpace):
                 "Spaces do not have consistent obs and/or axes."
             )
 
-        if all(space.has_limits for space in spaces):
+        has_limits = [space.has_limits for space in spaces]
+        if all(has_limits):
             # check overlap, reduce common limits
             pass
-        elif not any(space.has_limits for space in spaces):
+        elif not any(has_limits):
             spaces = [spaces[0]]  # if all are None, then nothing to add
         else:  # some have limits, some don't -> does not really make sense (or just drop the ones without limits?)
             raise LimitsIncompatibleError(
@@ -2747,7 +2909,7 @@ class MultiSpace(BaseSpace):
     @property
     def has_rect_limits(self) -> bool:
         """If there are limits and whether they are rectangular."""
-        return all(space.has_rect_limits for space in self.spaces)
+        return self._has_rect_limits
 
     # noinspection PyPropertyDefinition
 
@@ -2758,7 +2920,7 @@ class MultiSpace(BaseSpace):
         Returns:
             True if limits is False
         """
-        return all(space.limits_are_false for space in self.spaces)
+        return self._limits_are_false
 
     # noinspection PyPropertyDefinition
 
@@ -2780,7 +2942,7 @@ class MultiSpace(BaseSpace):
         Returns:
             Whether the limits have been set or not.
         """
-        return all(space.limits_are_set for space in self.spaces)
+        return self._limits_are_set
 
     @property
     def n_events(self) -> int | None:
@@ -2791,10 +2953,8 @@ class MultiSpace(BaseSpace):
                 it's vectorized.
         """
         # get the first numeric n_events. Is None if a Tensor and not specified yet.
-        n_events_first = [
-            space.n_events for space in self if space.n_events is not None
-        ]
-        n_events = None if not n_events_first else n_events_first[0]
+        n_events_all = (space.n_events for space in self)
+        n_events = next((n for n in n_events_all if n is not None), None)
         return n_events
 
     def with_limits(
@@ -3043,15 +3203,22 @@ class MultiSpace(BaseSpace):
         )
 
     def _inside(self, x, guarantee_limits):
-        inside_limits = [
-            space.inside(x, guarantee_limits=guarantee_limits) for space in self
-        ]
-        inside = znp.any(inside_limits, axis=0)  # has to be inside one limit
+        inside = None
+        for space in self.spaces:  # has to be inside one limit
+            inside_space = space.inside(x, guarantee_limits=guarantee_limits)
+            if inside is None:
+                inside = inside_space
+            else:
+                inside = znp.logical_or(inside, inside_space)
         return inside
 
     def __iter__(self) -> ZfitSpace:
         yield from self.spaces
 
+    @property
+    def n_limits(self) -> int:
+        return len(self.spaces)
+
     def __repr__(self):
         class_name = str(self.__class__).split(".")[-1].split("'")[0]
         if not self.limits_are_set:
@@ -3091,7 +3258,12 @@ class MultiSpace(BaseSpace):
         return all_less_equal
 
     def __hash__(self):
-        return hash(self.spaces)
+        # equality does not depend on the order of the spaces, so neither can the hash
+        hash_val = self._cached_hash
+        if hash_val is None:
+            hash_val = hash(frozenset(self.spaces))
+            self._cached_hash = hash_val
+        return hash_val
 
 
 def convert_to_space(
@@ -3180,6 +3352,22 @@ def check_norm(supports=None):
     if supports is None:
         supports = False
     supports = convert_to_container(supports, convert_none=True)
+    # fixed by the decorator, no need to look them up on every call
+    supports_all = supports[0] is True
+    supports_space = "space" in supports
+    supports_norm = "norm" in supports
+
+    def call_func(func, args, kwargs):
+        try:
+            return func(*args, **kwargs)
+        except TypeError as error:
+            if "got an unexpected keyword argument 'norm_range'" in str(error):
+                kwargs.pop("norm_range")
+            elif "got an unexpected keyword argument 'norm'" in str(error):
+                kwargs.pop("norm")
+            else:
+                raise
+            return func(*args, **kwargs)
 
     def no_norm_range(func):
         """Decorator: Catch the 'norm' kwargs. If not None, raise `NormNotImplemented`."""
@@ -3192,6 +3380,14 @@ def check_norm(supports=None):
         if "norm" in keys:
             norm_index = keys.index("norm")
 
+        if supports_all:  # any norm is fine, nothing to check
+
+            @functools.wraps(func)
+            def new_func(*args, **kwargs):
+                return call_func(func, args, kwargs)
+
+            return new_func
+
         @functools.wraps(func)
         def new_func(*args, **kwargs):
             if len(args) > 0:
@@ -3223,19 +3419,11 @@ def check_norm(supports=None):
             #         kwargs['norm'] = False
 
             # assume it's not supported. Switch if we find that it is supported.
-            norm_not_supported = not supports[0] is True
+            norm_not_supported = True
             if isinstance(norm, ZfitSpace):
-                if (
-                    "space" in supports
-                    and isinstance(self, ZfitPDF)
-                    and self.space == norm
-                ):
+                if supports_space and isinstance(self, ZfitPDF) and self.space == norm:
                     norm_not_supported = False
-                if (
-                    "norm" in supports
-                    and isinstance(self, ZfitPDF)
-                    and self.norm == norm
-                ):
+                if supports_norm and isinstance(self, ZfitPDF) and self.norm == norm:
                     norm_not_supported = False
                 if norm_not_supported:
                     norm_not_supported = not norm.limits_are_false
@@ -3255,16 +3443,7 @@ def check_norm(supports=None):
             if norm_not_supported:
                 raise NormNotImplemented()
             else:
-                try:
-                    return func(*args, **kwargs)
-                except TypeError as error:
-                    if "got an unexpected keyword argument 'norm_range'" in str(error):
-                        kwargs.pop("norm_range")
-                    elif "got an unexpected keyword argument 'norm'" in str(error):
-                        kwargs.pop("norm")
-                    else:
-                        raise
-                    return func(*args, **kwargs)
+                return call_func(func, args, kwargs)
 
         return new_func
 
@@ -3339,14 +3518,14 @@ def supports(
 
 
 def contains_tensor(objects):
-    tensor_found = tf.is_tensor(objects)
-    with suppress(TypeError):
-
-        for obj in objects:
-            if tensor_found:
-                break
-            tensor_found += contains_tensor(obj)
-    return tensor_found
+    for obj in tf.nest.flatten(objects):
+        if tf.is_tensor(obj):
+            return True
+        # numerical arrays are leaves without tensors, only object arrays can hold them
+        if isinstance(obj, np.ndarray) and obj.dtype == object:
+            if any(contains_tensor(o) for o in obj.flat):
+                return True
+    return False
 
 
 def shape_np_tf(objects):
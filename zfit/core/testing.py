@@ -14,11 +14,18 @@ import scipy.stats
 from .interfaces import ZfitPDF
 from ..util.container import convert_to_container
 
-__all__ = ["tester"]
+__all__ = ["tester", "make_params"]
 
 import scipy.integrate
 
 
+def make_params(prefix: str, values: Iterable) -> list:
+    """Create one `zfit.Parameter` per value, named `prefix` followed by its index."""
+    from .parameter import Parameter
+
+    return [Parameter(f"{prefix}{i}", val) for i, val in enumerate(values)]
+
+
 def check_integrate(func, limits, norm_range):
     if norm_range is not False:
         return check_integrate(func, limits, False) / check_integrate(
@@ -94,13 +94,17 @@ def compute_errors(
     fmin = result.fmin
     rtol *= errordef
     minimizer = result.minimizer
+    tol = minimizer.tol
+    downward_shift = errordef * sigma**2
     from zfit import run
 
     old_values = run(result)
 
-    covariance = result.covariance(method=covariance_method, as_dict=True)
-    param_errors = {param: covariance[(param, param)] ** 0.5 for param in params}
-    # param_scale = np.array(list(param_errors.values()))  # TODO: can be used for root finding initialization?
+    covariance = result.covariance(params=all_params, method=covariance_method)
+    param_indices = {param: i for i, param in enumerate(all_params)}
+    param_errors = np.diag(covariance) ** 0.5
+    result_values = np.array([result.params[p]["value"] for p in all_params])
+    # param_scale = param_errors  # TODO: can be used for root finding initialization?
 
     ncalls = 0
     try:
@@ -110,53 +114,50 @@ def compute_errors(
             assign_values(all_params, result)
 
             logging.info(f"profiling the parameter {param}")
-            param_error = param_errors[param]
-            param_value = result.params[param]["value"]
+            iparam = param_indices[param]
+            param_error = param_errors[iparam]
+            param_value = result_values[iparam]
             other_params = [p for p in all_params if p != param]
 
-            initial_values = {"lower": [], "upper": []}
             direction = {"lower": -sigma, "upper": sigma}
+            error_factors = covariance[iparam] * (2 * errordef / param_error**2) ** 0.5
+            initial_values = {
+                d: result_values + direction[d] * error_factors for d in direction
+            }
 
-            for ap in all_params:
-                ap_value = result.params[ap]["value"]
-                error_factor = (
-                    covariance[(param, ap)] * (2 * errordef / param_error**2) ** 0.5
-                )
-                for d in ["lower", "upper"]:
-                    ap_value_init = ap_value + direction[d] * error_factor
-                    initial_values[d].append(ap_value_init)
+            # the loss and gradient only depend on the values, shared by both directions
+            cache = {}
 
             # TODO: improvement, use jacobian?
-            # @np_cache(maxsize=25)
             def func(values, args):
                 nonlocal ncalls
-                ncalls += 1
                 swap_sign = args
 
-                assign_values(all_params, values)
-                try:
-                    loss_value, gradient = loss.value_gradient(params=other_params)
-                except tf.errors.InvalidArgumentError:
-                    msg = (
-                        f"The evaluation of the errors of {param.name} failed due to too many NaNs"
-                        " being produced in the loss and/or its gradient. This is most probably"
-                        " caused by negative values returned from the PDF."
-                    )
-                    raise FailEvalLossNaN(msg)
-
-                zeroed_loss = loss_value.numpy() - fmin
+                key = values.tobytes()
+                if key not in cache:
+                    ncalls += 1
+                    assign_values(all_params, values)
+                    try:
+                        loss_value, gradient = loss.value_gradient(params=other_params)
+                    except tf.errors.InvalidArgumentError:
+                        msg = (
+                            f"The evaluation of the errors of {param.name} failed due to too many NaNs"
+                            " being produced in the loss and/or its gradient. This is most probably"
+                            " caused by negative values returned from the PDF."
+                        )
+                        raise FailEvalLossNaN(msg)
+                    cache[key] = loss_value.numpy() - fmin, np.array(gradient)
+                zeroed_loss, gradient = cache[key]
 
-                gradient = np.array(gradient)
                 if swap_sign(param):  # mirror at x-axis to remove second zero
                     zeroed_loss = -zeroed_loss
                     gradient = -gradient
                     logging.info("Swapping sign in error calculation 'zfit_error'")
 
-                elif zeroed_loss < -minimizer.tol:
+                elif zeroed_loss < -tol:
                     assign_values(all_params, values)  # set values to the new minimum
                     raise NewMinimum("A new minimum is found.")
 
-                downward_shift = errordef * sigma**2
                 shifted_loss = zeroed_loss - downward_shift
 
                 return np.concatenate([[shifted_loss], gradient])
@@ -170,7 +171,7 @@ def compute_errors(
                 roots = optimize.root(
                     fun=func,
                     args=(swap_sign[d],),
-                    x0=np.array(initial_values[d]),
+                    x0=initial_values[d],
                     tol=rtol,
                     options={
                         "factor": 0.1,
@@ -179,7 +180,7 @@ def compute_errors(
                     },
                     method=method,
                 )
-                to_return[param][d] = roots.x[all_params.index(param)] - param_value
+                to_return[param][d] = roots.x[iparam] - param_value
                 # print(f"error {d}, time needed {time.time() - start2}")
         # print(f"errors found, time needed {time.time() - start}")
         assign_values(all_params, old_values)
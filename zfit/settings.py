@@ -53,6 +53,7 @@ options = DotMap(
         "numerical_grad": None,
         "advanced_warning": True,
         "changed_warning": True,
+        "xla_inside": False,
     }
 )
 
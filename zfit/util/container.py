@@ -32,6 +32,15 @@ def convert_to_container(
 
     Returns:
     """
+    if non_containers is None:
+        non_containers = []
+    if not isinstance(non_containers, list):
+        raise TypeError("`non_containers` have to be a list or a tuple")
+    if value is None and not convert_none:
+        return value
+    if type(value) is container:  # already converted, nothing to do
+        return value
+
     from ..core.interfaces import ZfitData, ZfitBinnedData  # here due to dependency
     from ..core.interfaces import (
         ZfitLoss,
@@ -41,34 +50,27 @@ def convert_to_container(
         ZfitBinning,
     )
 
-    if non_containers is None:
-        non_containers = []
-    if not isinstance(non_containers, list):
-        raise TypeError("`non_containers` have to be a list or a tuple")
-    if value is None and not convert_none:
-        return value
-    if not type(value) == container:
-        non_containers.extend(
-            [
-                str,
-                tf.Tensor,
-                ZfitData,
-                ZfitLoss,
-                ZfitModel,
-                ZfitSpace,
-                ZfitParameter,
-                ZfitBinnedData,
-                ZfitBinning,
-                PlottableHistogram,
-            ]
-        )
-        non_containers = tuple(non_containers)
-        try:
-            if isinstance(value, non_containers):
-                raise TypeError  # we can't convert, it's a non-container
-            value = container(value)
-        except (TypeError, AttributeError):  # by tf, it can't convert
-            value = container((value,))
+    non_containers.extend(
+        [
+            str,
+            tf.Tensor,
+            ZfitData,
+            ZfitLoss,
+            ZfitModel,
+            ZfitSpace,
+            ZfitParameter,
+            ZfitBinnedData,
+            ZfitBinning,
+            PlottableHistogram,
+        ]
+    )
+    non_containers = tuple(non_containers)
+    try:
+        if isinstance(value, non_containers):
+            raise TypeError  # we can't convert, it's a non-container
+        value = container(value)
+    except (TypeError, AttributeError):  # by tf, it can't convert
+        value = container((value,))
     return value
 
 